@@ -11,24 +11,65 @@ Designed for GitHub Pages project site at /blog/.
 from __future__ import annotations
 
 import datetime as dt
+import functools
+import os
+import pickle
 import re
 import shutil
+import string
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Callable, Dict, List, Tuple
 
-import markdown2
+import cmarkgfm
+import orjson
 import yaml
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from cmarkgfm.cmark import Options as CmarkOptions
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template, select_autoescape
+
+try:
+    # libyaml-backed loader, much faster than the pure-Python one
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
 
 ROOT = Path(__file__).resolve().parent
 CONTENT = ROOT / "content"
 TEMPLATES = ROOT / "templates"
 ASSETS = ROOT / "assets"
 DIST = ROOT / "dist"
+JINJA_CACHE = ROOT / ".jinja-cache"
+BUILD_CACHE = ROOT / ".build-cache.pkl"
+# bump when Post or the Markdown pipeline changes so stale entries are dropped
+BUILD_CACHE_VERSION = 2
+
+# os.open is text mode on Windows unless asked otherwise
+O_BINARY = getattr(os, "O_BINARY", 0)
+
+# In-process a post costs ~0.07 ms to parse and ~0.26 ms to render; the pool
+# adds fork startup plus ~0.1 ms of pickling per post. Measured on one CPU
+# the pool never won (1000 posts: 377 ms vs 262 ms to render), so only use it
+# for large sites on multi-core machines.
+PARALLEL_MIN_ITEMS = 500
 
-FM_RE = re.compile(r"\A---\s*\n(.*?)\n---\s*\n(.*)\Z", re.S)
 SLUG_RE = re.compile(r"[^a-z0-9]+")
+TAG_RE = re.compile(r"<[^>]+>")
+# extract_excerpt looks at the first limit * this many chars of HTML
+EXCERPT_SCAN_FACTOR = 6
+DATE_PREFIX_RE = re.compile(r"(\d{4}-\d{2}-\d{2})-")
+FM_KEY_RE = re.compile(r"[A-Za-z_][\w-]*\Z")
+# a plain scalar starting with one of these means something to YAML
+FM_INDICATORS = "-?:,[]{}#&*!|>'\"%@`"
+# plain scalars inside [...] stop or fail at these
+FM_FLOW_INDICATORS = ":?#[]{}"
+
+# ASCII fast path for slugify: everything but [a-z0-9] becomes "-"
+SLUG_TABLE = {c: "-" for c in range(128) if chr(c) not in string.ascii_lowercase + string.digits}
+
+# cmark-gfm: keep raw HTML in posts (markdown2 passed it through too)
+MD_OPTIONS = CmarkOptions.CMARK_OPT_UNSAFE
+MD_EXTENSIONS = ["table", "strikethrough", "tasklist"]
 
 
 @dataclass
@@ -43,49 +84,185 @@ class Post:
     category: str
     level: str
     hero: str | None
+    # preformatted dates so templates don't strftime on every render
+    date_iso: str
+    date_rfc822: str
+    date_display: str
 
 
 def slugify(text: str) -> str:
     s = text.strip().lower()
-    s = SLUG_RE.sub("-", s).strip("-")
+    if s.isascii():
+        s = s.translate(SLUG_TABLE)
+    else:
+        s = SLUG_RE.sub("-", s)
+    # collapse runs of "-" and trim both ends
+    s = "-".join(filter(None, s.split("-")))
     return s or "post"
 
 
+_YAML_RESOLVER = yaml.resolver.Resolver()
+
+
+def resolves_to_str(plain: str) -> bool:
+    # unquoted true/null/1.5/2026-01-19/... resolve to non-str types
+    return _YAML_RESOLVER.resolve(yaml.ScalarNode, plain, (True, False)) == "tag:yaml.org,2002:str"
+
+
+def simple_scalar(raw: str, flow: bool = False) -> str | None:
+    """Value of a one-line YAML string scalar, or None if it needs real YAML.
+
+    flow marks an item inside `[...]`, where plain scalars may not contain
+    flow indicators.
+    """
+    if not raw:
+        return None
+    quote = raw[0]
+    if quote in "\"'" and len(raw) >= 2 and raw[-1] == quote:
+        inner = raw[1:-1]
+        if quote in inner or "\\" in inner:
+            return None
+        return inner
+    if raw[0] in FM_INDICATORS or ": " in raw or " #" in raw or raw.endswith(":"):
+        return None
+    if flow and any(c in raw for c in FM_FLOW_INDICATORS):
+        return None
+    return raw if resolves_to_str(raw) else None
+
+
+def parse_simple_front_matter(fm_raw: str) -> Dict[str, Any] | None:
+    """Fast path for flat `key: value` / `key: [a, b]` front matter.
+
+    Returns None when the block uses anything beyond that (nesting, anchors,
+    block scalars, non-string scalars, ...), so the caller can fall back to YAML.
+    """
+    fm: Dict[str, Any] = {}
+    for line in fm_raw.split("\n"):
+        # tabs, control chars and other line breaks all need PyYAML's rules
+        if not line.isprintable():
+            return None
+        if not line.strip() or line.startswith("#"):
+            continue
+        if line[0] == " ":
+            return None
+        key, sep, val = line.partition(":")
+        if not sep or not FM_KEY_RE.match(key) or not resolves_to_str(key):
+            return None
+        if val and val[0] != " ":
+            return None
+        val = val.strip()
+        if not val:
+            fm[key] = None
+        elif val[0] == "[":
+            inner = val[1:-1].strip()
+            if val[-1] != "]" or any(c in inner for c in "[]{}"):
+                return None
+            items = [simple_scalar(item.strip(), flow=True) for item in inner.split(",")] if inner else []
+            if None in items:
+                return None
+            fm[key] = items
+        else:
+            scalar = simple_scalar(val)
+            if scalar is None:
+                return None
+            fm[key] = scalar
+    return fm
+
+
+def split_front_matter(md: str) -> Tuple[str, str] | None:
+    """Split `---` fenced front matter off md; None if there is none.
+
+    Plain str.find scans only up to the closing fence, where a DOTALL regex
+    walked the whole body. The closing fence is simply the first `---` line
+    after the opening one, so back-to-back fences (`---\n---\n`) are an
+    empty block, and blank lines just inside the fences are kept.
+    """
+    if not md.startswith("---"):
+        return None
+    start = md.find("\n") + 1
+    if not start or md[3:start].strip():
+        return None
+    end = start - 1
+    while True:
+        end = md.find("\n---", end)
+        if end == -1:
+            return None
+        eol = md.find("\n", end + 4)
+        if eol == -1:
+            return None
+        # the fence may carry trailing whitespace, nothing else
+        if not md[end + 4:eol].strip():
+            return md[start:end], md[eol + 1:]
+        end = eol
+
+
 def parse_front_matter(md: str, source: Path) -> Tuple[Dict[str, Any], str]:
-    m = FM_RE.match(md)
-    if not m:
+    split = split_front_matter(md)
+    if split is None:
         return {}, md
-    fm_raw, body = m.group(1), m.group(2)
+    fm_raw, body = split
+    fm = parse_simple_front_matter(fm_raw)
+    if fm is not None:
+        return fm, body
     try:
-        fm = yaml.safe_load(fm_raw) or {}
+        fm = yaml.load(fm_raw, Loader=SafeLoader) or {}
     except Exception as e:
         raise ValueError(f"Invalid YAML front matter in {source}: {e}")
     return fm, body
 
 
 def md_to_html(md: str) -> str:
-    # extras for nicer output
-    return markdown2.markdown(md, extras=[
-        "fenced-code-blocks",
-        "tables",
-        "strike",
-        "task_list",
-        "cuddled-lists",
-        "metadata",
-    ])
+    # fenced code is core CommonMark; front matter is stripped before we get here
+    return cmarkgfm.markdown_to_html_with_extensions(
+        md, options=MD_OPTIONS, extensions=MD_EXTENSIONS
+    )
 
 
 def extract_excerpt(html: str, limit: int = 180) -> str:
+    # Only scan a prefix of long posts: stripping tags and spaces can only
+    # shrink text, and ending the prefix before a cut-off tag keeps its text
+    # an exact prefix of the full result.
+    head = html[: limit * EXCERPT_SCAN_FACTOR]
+    if len(head) < len(html):
+        lt = head.find("<", head.rfind(">") + 1)
+        if lt != -1:
+            head = head[:lt]
     # Remove tags and compress spaces
-    text = re.sub(r"<[^>]+>", "", html)
-    text = re.sub(r"\s+", " ", text).strip()
+    text = " ".join(TAG_RE.sub("", head).split())
+    if len(text) <= limit and len(head) < len(html):
+        # prefix was mostly markup; fall back to the whole post
+        text = " ".join(TAG_RE.sub("", html).split())
     if len(text) <= limit:
         return text
     return text[: limit - 1].rstrip() + "…"
 
 
+def read_bytes(path: Path) -> bytes:
+    # plain os.open/os.read: skips the TextIOWrapper/BufferedReader setup
+    # (and its isatty/lseek calls) that open() does for every small file
+    fd = os.open(path, os.O_RDONLY | O_BINARY)
+    try:
+        chunks = []
+        while True:
+            b = os.read(fd, 65536)
+            if not b:
+                break
+            chunks.append(b)
+    finally:
+        os.close(fd)
+    return b"".join(chunks)
+
+
+def read_text(path: Path) -> str:
+    text = read_bytes(path).decode("utf-8")
+    # match Path.read_text's universal newlines
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
 def load_config() -> Dict[str, Any]:
-    cfg = yaml.safe_load((ROOT / "site.yml").read_text(encoding="utf-8"))
+    cfg = yaml.load(read_text(ROOT / "site.yml"), Loader=SafeLoader)
     assert isinstance(cfg, dict)
     return cfg
 
@@ -93,13 +270,35 @@ def load_config() -> Dict[str, Any]:
 def load_stats() -> Dict[str, Any]:
     """Load network stats from stats.json if it exists."""
     stats_file = ROOT / "stats.json"
-    if stats_file.exists():
-        try:
-            import json
-            return json.loads(stats_file.read_text(encoding="utf-8"))
-        except Exception:
-            pass
-    return {"bitcoin": {}, "lightning": {}}
+    try:
+        mtime = stats_file.stat().st_mtime_ns
+    except OSError:
+        return {"bitcoin": {}, "lightning": {}}
+    return _load_stats(stats_file, mtime)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_stats(stats_file: Path, mtime_ns: int) -> Dict[str, Any]:
+    # keyed on mtime so every caller shares one dict until stats.json changes
+    try:
+        return orjson.loads(read_bytes(stats_file))
+    except Exception:
+        return {"bitcoin": {}, "lightning": {}}
+
+
+def parallel_map(
+    fn: Callable[[Any], Any],
+    items: List[Any],
+    initializer: Callable[..., None] | None = None,
+    initargs: Tuple[Any, ...] = (),
+) -> List[Any]:
+    """Map fn over items in worker processes; small batches stay in-process."""
+    if len(items) < PARALLEL_MIN_ITEMS or (os.cpu_count() or 1) == 1:
+        if initializer is not None:
+            initializer(*initargs)
+        return list(map(fn, items))
+    with ProcessPoolExecutor(initializer=initializer, initargs=initargs) as ex:
+        return list(ex.map(fn, items, chunksize=8))
 
 
 def ensure_dist() -> None:
@@ -108,65 +307,122 @@ def ensure_dist() -> None:
     DIST.mkdir(parents=True, exist_ok=True)
 
 
+def link_or_copy(src: str, dst: str) -> None:
+    # dist/ is only read after the build, so sharing the inode is safe
+    try:
+        os.link(src, dst)
+    except OSError:  # cross-device, or a filesystem without hard links
+        shutil.copy2(src, dst)
+
+
 def copy_assets() -> None:
-    shutil.copytree(ASSETS, DIST / "assets")
+    shutil.copytree(ASSETS, DIST / "assets", copy_function=link_or_copy)
+
+
+def load_post(path: Path) -> Post:
+    raw = read_text(path)
+    fm, body = parse_front_matter(raw, path)
+
+    title = str(fm.get("title") or path.stem)
+    date_raw = fm.get("date")
+    if date_raw:
+        # allow YYYY-MM-DD
+        date = dt.date.fromisoformat(str(date_raw))
+    else:
+        # support filename prefix YYYY-MM-DD-
+        m = DATE_PREFIX_RE.match(path.name)
+        if not m:
+            raise ValueError(f"Post {path} needs date in front matter or filename YYYY-MM-DD-*")
+        date = dt.date.fromisoformat(m.group(1))
+
+    slug = str(fm.get("slug") or slugify(title))
+    category = str(fm.get("category") or "mining")
+    tags = fm.get("tags") or []
+    if isinstance(tags, str):
+        tags = [t.strip() for t in tags.split(",") if t.strip()]
+    tags = list(map(str, tags))
+    level = str(fm.get("level") or "1-1")
+    hero = fm.get("hero")
+
+    html = md_to_html(body)
+    excerpt = extract_excerpt(html)
+
+    url = f"/posts/{slug}/"
+    return Post(
+        title=title,
+        date=date,
+        slug=slug,
+        url=url,
+        html=html,
+        excerpt=excerpt,
+        tags=tags,
+        category=category,
+        level=level,
+        hero=str(hero) if hero else None,
+        date_iso=date.isoformat(),
+        date_rfc822=date.strftime("%a, %d %b %Y 00:00:00 +0000"),
+        date_display=date.strftime("%d.%m.%Y"),
+    )
+
+
+def load_build_cache() -> Dict[str, Tuple[int, Post]]:
+    """Load {path: (mtime_ns, Post)} from the previous build, if usable."""
+    try:
+        with BUILD_CACHE.open("rb") as f:
+            version, entries = pickle.load(f)
+    except Exception:
+        return {}
+    return entries if version == BUILD_CACHE_VERSION else {}
+
+
+def save_build_cache(entries: Dict[str, Tuple[int, Post]]) -> None:
+    with BUILD_CACHE.open("wb") as f:
+        pickle.dump((BUILD_CACHE_VERSION, entries), f, protocol=pickle.HIGHEST_PROTOCOL)
 
 
 def build_posts(cfg: Dict[str, Any]) -> List[Post]:
     posts_dir = CONTENT / "posts"
-    posts: List[Post] = []
+    cache = load_build_cache()
+    entries: Dict[str, Tuple[int, Post]] = {}
+    stale: List[Tuple[Path, int]] = []
+
+    # DirEntry answers is_file() from the directory read itself
+    with os.scandir(posts_dir) as it:
+        found = sorted((e for e in it if e.name.endswith(".md") and e.is_file()), key=lambda e: e.name)
+    paths = [Path(e.path) for e in found]
+
+    # reuse parsed posts whose source is unchanged since the last build
+    for entry, path in zip(found, paths):
+        mtime = entry.stat().st_mtime_ns
+        hit = cache.get(entry.path)
+        if hit and hit[0] == mtime:
+            entries[entry.path] = hit
+        else:
+            stale.append((path, mtime))
 
-    for path in sorted(posts_dir.glob("*.md")):
-        raw = path.read_text(encoding="utf-8")
-        fm, body = parse_front_matter(raw, path)
+    fresh = parallel_map(load_post, [path for path, _ in stale])
+    for (path, mtime), post in zip(stale, fresh):
+        entries[str(path)] = (mtime, post)
 
-        title = str(fm.get("title") or path.stem)
-        date_raw = fm.get("date")
-        if date_raw:
-            # allow YYYY-MM-DD
-            date = dt.date.fromisoformat(str(date_raw))
-        else:
-            # support filename prefix YYYY-MM-DD-
-            m = re.match(r"(\d{4}-\d{2}-\d{2})-", path.name)
-            if not m:
-                raise ValueError(f"Post {path} needs date in front matter or filename YYYY-MM-DD-*")
-            date = dt.date.fromisoformat(m.group(1))
-
-        slug = str(fm.get("slug") or slugify(title))
-        category = str(fm.get("category") or "mining")
-        tags = fm.get("tags") or []
-        if isinstance(tags, str):
-            tags = [t.strip() for t in tags.split(",") if t.strip()]
-        tags = list(map(str, tags))
-        level = str(fm.get("level") or "1-1")
-        hero = fm.get("hero")
-
-        html = md_to_html(body)
-        excerpt = extract_excerpt(html)
-
-        url = f"/posts/{slug}/"
-        posts.append(Post(
-            title=title,
-            date=date,
-            slug=slug,
-            url=url,
-            html=html,
-            excerpt=excerpt,
-            tags=tags,
-            category=category,
-            level=level,
-            hero=str(hero) if hero else None,
-        ))
+    save_build_cache(entries)
+    posts = [entries[str(path)][1] for path in paths]
 
     # newest first
     posts.sort(key=lambda p: p.date, reverse=True)
     return posts
 
 
+@functools.lru_cache(maxsize=1)
 def jinja_env() -> Environment:
+    # one Environment per process; compiled template bytecode is kept on disk
+    # so the next build skips parsing/compiling unchanged templates
+    JINJA_CACHE.mkdir(exist_ok=True)
     return Environment(
         loader=FileSystemLoader(str(TEMPLATES)),
         autoescape=select_autoescape(["html", "xml"]),
+        bytecode_cache=FileSystemBytecodeCache(str(JINJA_CACHE)),
+        cache_size=400,
+        auto_reload=False,
     )
 
 
@@ -178,19 +434,45 @@ def make_url(base_url: str, path: str) -> str:
     return f"{base}{path}"
 
 
-def write_text(path: Path, content: str) -> None:
+def write_bytes(path: Path, data: bytes) -> None:
+    # raw fd + os.write: skips the BufferedWriter that Path.write_bytes sets up
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(content, encoding="utf-8")
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | O_BINARY, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            n = os.write(fd, view)
+            if n == 0:
+                raise OSError(f"short write to {path}")
+            view = view[n:]
+    finally:
+        os.close(fd)
 
 
-def render_site(cfg: Dict[str, Any], posts: List[Post]) -> None:
-    env = jinja_env()
+def render_to(path: Path, tmpl: Template, **ctx: Any) -> None:
+    # one encode, then usually a single write() syscall
+    write_bytes(path, tmpl.render(**ctx).encode("utf-8"))
 
-    base_url = str(cfg["site"].get("base_url", ""))
 
+def configure_env(base_url: str, ctx_base: Dict[str, Any]) -> Environment:
+    """Set up this process's Environment; also the render pool initializer."""
+    env = jinja_env()
     # Provide helper in templates
     env.globals["url"] = lambda p: make_url(base_url, p)
-    env.globals["now"] = lambda: dt.datetime.utcnow().strftime("%Y")
+    year = dt.datetime.now(dt.timezone.utc).strftime("%Y")
+    env.globals["now"] = lambda: year
+    # shared by every page, so each render only passes its own variables
+    env.globals.update(ctx_base)
+    return env
+
+
+def render_post(post: Post) -> None:
+    tmpl = jinja_env().get_template("post.html")
+    render_to(DIST / "posts" / post.slug / "index.html", tmpl, post=post)
+
+
+def render_site(cfg: Dict[str, Any], posts: List[Post]) -> None:
+    base_url = str(cfg["site"].get("base_url", ""))
 
     stats = load_stats()
     ctx_base = {
@@ -199,33 +481,27 @@ def render_site(cfg: Dict[str, Any], posts: List[Post]) -> None:
         "base_url": base_url,
         "stats": stats,
     }
+    env = configure_env(base_url, ctx_base)
 
     # Index
     tmpl = env.get_template("index.html")
-    out = tmpl.render(**ctx_base, posts=posts[:12])
-    write_text(DIST / "index.html", out)
+    render_to(DIST / "index.html", tmpl, posts=posts[:12])
 
     # Archive
     tmpl = env.get_template("archive.html")
-    out = tmpl.render(**ctx_base, posts=posts)
-    write_text(DIST / "archive" / "index.html", out)
+    render_to(DIST / "archive" / "index.html", tmpl, posts=posts)
 
     # About
     tmpl = env.get_template("about.html")
-    out = tmpl.render(**ctx_base)
-    write_text(DIST / "about" / "index.html", out)
+    render_to(DIST / "about" / "index.html", tmpl)
 
     # Posts
-    tmpl = env.get_template("post.html")
-    for p in posts:
-        out = tmpl.render(**ctx_base, post=p)
-        write_text(DIST / "posts" / p.slug / "index.html", out)
+    parallel_map(render_post, posts, configure_env, (base_url, ctx_base))
 
     # RSS Feed
     tmpl = env.get_template("feed.xml")
-    build_date = dt.datetime.utcnow().strftime('%a, %d %b %Y %H:%M:%S +0000')
-    out = tmpl.render(**ctx_base, posts=posts[:20], build_date=build_date)
-    write_text(DIST / "feed.xml", out)
+    build_date = dt.datetime.now(dt.timezone.utc).strftime('%a, %d %b %Y %H:%M:%S +0000')
+    render_to(DIST / "feed.xml", tmpl, posts=posts[:20], build_date=build_date)
 
 
 def main() -> None:
@@ -5,54 +5,81 @@ Writes to stats.json for inclusion in static site build.
 Uses mempool.space API (no auth required).
 """
 
-import json
-import urllib.request
-import urllib.error
+import asyncio
 from pathlib import Path
 
+import httpx
+import orjson
+
 ROOT = Path(__file__).resolve().parent
 STATS_FILE = ROOT / "stats.json"
 
 MEMPOOL_API = "https://mempool.space/api/v1"
 MEMPOOL_API_V2 = "https://mempool.space/api"
 
+# Every endpoint we need, fetched concurrently; results are keyed by name.
+URLS = {
+    "tip": f"{MEMPOOL_API_V2}/blocks/tip/height",
+    "hashrate": f"{MEMPOOL_API}/mining/hashrate/3d",
+    "mempool": f"{MEMPOOL_API_V2}/mempool",
+    "fees": f"{MEMPOOL_API_V2}/v1/fees/recommended",
+    "lightning": f"{MEMPOOL_API}/lightning/statistics/latest",
+}
+
 
-def fetch_json(url: str, timeout: int = 30) -> dict | list | None:
+async def fetch_json(client: httpx.AsyncClient, url: str) -> dict | list | None:
     """Fetch JSON from URL, return None on error."""
     try:
-        req = urllib.request.Request(url, headers={"User-Agent": "mars-blog-stats/1.0"})
-        with urllib.request.urlopen(req, timeout=timeout) as resp:
-            return json.loads(resp.read().decode("utf-8"))
-    except (urllib.error.URLError, json.JSONDecodeError, TimeoutError) as e:
+        resp = await client.get(url)
+        resp.raise_for_status()
+        # some endpoints (e.g. tip height) answer text/plain, so skip resp.json()
+        return orjson.loads(resp.content)
+    except (httpx.HTTPError, orjson.JSONDecodeError) as e:
         print(f"Error fetching {url}: {e}")
         return None
 
 
+async def fetch_all(timeout: int = 30) -> dict:
+    """Fetch all URLS concurrently, return {name: json or None}."""
+    # HTTP/2 multiplexes every request over one kept-alive TLS connection
+    async with httpx.AsyncClient(
+        http2=True,
+        headers={"User-Agent": "mars-blog-stats/1.0"},
+        timeout=timeout,
+    ) as client:
+        results = await asyncio.gather(*(fetch_json(client, url) for url in URLS.values()))
+    return dict(zip(URLS, results))
+
+
+# largest first; format_number uses the first threshold n reaches
+NUMBER_SUFFIXES = (
+    (1_000_000_000_000, "T"),
+    (1_000_000_000, "B"),
+    (1_000_000, "M"),
+    (1_000, "K"),
+)
+
+
 def format_number(n: int | float, decimals: int = 0) -> str:
     """Format large numbers with K/M/T suffixes."""
-    if n >= 1_000_000_000_000:
-        return f"{n / 1_000_000_000_000:.{decimals}f}T"
-    if n >= 1_000_000_000:
-        return f"{n / 1_000_000_000:.{decimals}f}B"
-    if n >= 1_000_000:
-        return f"{n / 1_000_000:.{decimals}f}M"
-    if n >= 1_000:
-        return f"{n / 1_000:.{decimals}f}K"
+    for threshold, suffix in NUMBER_SUFFIXES:
+        if n >= threshold:
+            return f"{n / threshold:.{decimals}f}{suffix}"
     return f"{n:.{decimals}f}" if decimals else str(int(n))
 
 
-def fetch_bitcoin_stats() -> dict:
-    """Fetch Bitcoin network stats from mempool.space."""
+def fetch_bitcoin_stats(data: dict) -> dict:
+    """Build Bitcoin network stats from fetched mempool.space data."""
     stats = {}
 
     # Block height and difficulty
-    tip = fetch_json(f"{MEMPOOL_API_V2}/blocks/tip/height")
+    tip = data.get("tip")
     if tip is not None:
         stats["block_height"] = tip
         stats["block_height_fmt"] = format_number(tip)
 
     # Hashrate and difficulty
-    hashrate_data = fetch_json(f"{MEMPOOL_API}/mining/hashrate/3d")
+    hashrate_data = data.get("hashrate")
     if hashrate_data and "currentHashrate" in hashrate_data:
         hr = hashrate_data["currentHashrate"]
         stats["hashrate_eh"] = round(hr / 1e18, 1)
@@ -63,14 +90,14 @@ def fetch_bitcoin_stats() -> dict:
         stats["difficulty_fmt"] = format_number(diff, 1)
 
     # Mempool stats
-    mempool = fetch_json(f"{MEMPOOL_API_V2}/mempool")
+    mempool = data.get("mempool")
     if mempool:
         stats["mempool_tx_count"] = mempool.get("count", 0)
         stats["mempool_tx_count_fmt"] = format_number(mempool.get("count", 0))
         stats["mempool_size_mb"] = round(mempool.get("vsize", 0) / 1_000_000, 1)
 
     # Fee estimates (sat/vB)
-    fees = fetch_json(f"{MEMPOOL_API_V2}/v1/fees/recommended")
+    fees = data.get("fees")
     if fees:
         stats["fee_fast"] = fees.get("fastestFee", 0)
         stats["fee_medium"] = fees.get("halfHourFee", 0)
@@ -79,11 +106,11 @@ def fetch_bitcoin_stats() -> dict:
     return stats
 
 
-def fetch_lightning_stats() -> dict:
-    """Fetch Lightning Network stats from mempool.space."""
+def fetch_lightning_stats(data: dict) -> dict:
+    """Build Lightning Network stats from fetched mempool.space data."""
     stats = {}
 
-    ln_stats = fetch_json(f"{MEMPOOL_API}/lightning/statistics/latest")
+    ln_stats = data.get("lightning")
     if ln_stats:
         stats["node_count"] = ln_stats.get("latest", {}).get("node_count", 0)
         stats["node_count_fmt"] = format_number(ln_stats.get("latest", {}).get("node_count", 0))
@@ -103,11 +130,10 @@ def fetch_lightning_stats() -> dict:
 
 
 def main():
-    print("Fetching Bitcoin stats...")
-    btc = fetch_bitcoin_stats()
-
-    print("Fetching Lightning stats...")
-    ln = fetch_lightning_stats()
+    print("Fetching Bitcoin and Lightning stats...")
+    data = asyncio.run(fetch_all())
+    btc = fetch_bitcoin_stats(data)
+    ln = fetch_lightning_stats(data)
 
     stats = {
         "bitcoin": btc,
@@ -115,10 +141,11 @@ def main():
     }
 
     print(f"Writing stats to {STATS_FILE}")
-    STATS_FILE.write_text(json.dumps(stats, indent=2), encoding="utf-8")
+    payload = orjson.dumps(stats, option=orjson.OPT_INDENT_2)
+    STATS_FILE.write_bytes(payload)
 
     print("Done!")
-    print(json.dumps(stats, indent=2))
+    print(payload.decode("utf-8"))
 
 
 if __name__ == "__main__":